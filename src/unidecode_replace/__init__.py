@@ -10,5 +10,6 @@ from .match import UnidecodeReMatch  # noqa: W0601
 from .replace import SearchT, SubT, u2iT, UnidecodeReplace  # noqa: W0601
 from .replicas import can_be_unidecoded, get_invalid_chars  # noqa: W0601
 from .search_item import (  # noqa: W0601
-    SearchItem, SearchItemStr, SearchItemRegex,
+    SearchItem, SearchItemStr, SearchItemRegex, SearchItemStrASCII,
+    SearchItemRegexASCII,
 )
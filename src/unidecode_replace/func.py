@@ -3,10 +3,12 @@ Functions for easier calls to `UnidecodeReplace`.
 """
 
 import re
-from typing import Optional
+from typing import Optional, cast
 
 from .match import UnidecodeReMatch
-from .replace import SearchT, SubT, UnidecodeReplace
+from .replace import (
+    SearchT, SimpleSearchT, SimpleSubT, SubT, UnidecodeReplace,
+)
 
 
 def unidecode_replace(
@@ -154,9 +156,32 @@ def unidecode_wrap(
         affect regex searching.
     :return: A copy of `string` with matched substrings replaced.
     """
-    def sub(s: str | re.Match | UnidecodeReMatch) -> str:
-        text = s.group(0) if isinstance(s, (re.Match, UnidecodeReMatch)) else s
-        return f"{prefix}{text}{suffix}"
+    def str_sub(s: str) -> str:
+        return f"{prefix}{s}{suffix}"
+
+    def re_sub(m: UnidecodeReMatch) -> str:
+        return f"{prefix}{m[0]}{suffix}"
+
+    def get_sub(one_search: SimpleSearchT) -> SimpleSubT:
+        """
+        Return the wrapping function for `one_search`.
+
+        String searches pass found substrings to their subs, while regex
+        searches pass their matches, so the right one is picked once per
+        search instead of checking the type of the argument on each call.
+        """
+        return cast(
+            SimpleSubT,
+            re_sub
+            if re_search or isinstance(one_search, re.Pattern) else
+            str_sub,
+        )
+
+    sub: SubT = (
+        get_sub(search)
+        if isinstance(search, (str, re.Pattern)) else
+        [get_sub(one_search) for one_search in search]
+    )
 
     return unidecode_replace(
         string,
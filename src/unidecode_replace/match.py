@@ -2,8 +2,10 @@
 Unidecode-compatible wrapper for `re.Match`.
 """
 
+import bisect
+import functools
 import re
-from typing import Optional, TypeVar, TYPE_CHECKING, cast
+from typing import Optional, TypeVar, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -13,11 +15,59 @@ if TYPE_CHECKING:
 _T = TypeVar("_T")
 
 
-def _nnstr(s: Optional[str]) -> str:
+def _get_markers_base(template: str, size: int) -> int:
     """
-    Return non-`None` string (empty string if `s` is `None` or `s` otherwise).
+    Return the first code point of `size` characters not used in `template`.
+
+    The result is never below 0x100, because escapes in templates can produce
+    characters that are not in the template (like `"\\n"` or `"\\101"`), but
+    all of them are below that.
+    """
+    base = 0x100
+    for code in sorted({ord(char) for char in template}):
+        if code - base >= size:
+            break
+        if code >= base:
+            base = code + 1
+    return base
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_template(pattern: re.Pattern, template: str) -> tuple[str, int]:
     """
-    return "" if s is None else s
+    Return `template` expanded with markers in place of group references.
+
+    This lets `re` itself do the parsing of `template`, while the expansion in
+    :py:meth:`UnidecodeReMatch.expand` is reduced to a single
+    :py:meth:`str.translate`.
+
+    The expansion is done with a "probe" match, which has the same groups as
+    `pattern`, but with each group `idx` (including the whole match as group
+    0) matching a marker character `chr(base + idx)`, where `base` is chosen
+    so that markers do not appear in the result otherwise.
+
+    :param pattern: The regex whose groups are referenced in `template`.
+    :param template: The template, as used by :py:meth:`re.Match.expand`.
+    :raise re.error: Raised if `template` is invalid.
+    :raise IndexError: Raised if `template` references non-existent groups.
+    :return: A tuple `(marked, base)`, where `marked` is `template` expanded
+        with markers in place of references to groups.
+    """
+    base = _get_markers_base(template, pattern.groups + 1)
+    names = {idx: name for name, idx in pattern.groupindex.items()}
+    markers = [chr(base + idx) for idx in range(pattern.groups + 1)]
+    groups = "".join(
+        f"(?P<{names[idx]}>{marker})" if idx in names else f"({marker})"
+        for idx, marker in enumerate(markers[1:], start=1)
+    )
+    # Groups are in a lookahead, so that the whole match is only the marker
+    # for group 0.
+    probe = re.match(f"{markers[0]}(?={groups})", "".join(markers))
+    if probe is None:
+        raise RuntimeError(  # pragma: no cover
+            f"BUG: probe match failed for template {repr(template)}",
+        )
+    return probe.expand(template), base
 
 
 class UnidecodeReMatch:
@@ -40,6 +90,12 @@ class UnidecodeReMatch:
     ) -> None:
         self._unidecode_replace = unidecode_replace
         self._original = original
+        # A shortcut for the heavily used mapping of indices.
+        self._u2i = unidecode_replace.u2i
+        # Re-mapped results, computed on first use.
+        self._spans: dict[int | str, tuple[int, int]] = dict()
+        self._groups: Optional[tuple[Optional[str], ...]] = None
+        self._groupdict: Optional[dict[str, Optional[str]]] = None
 
     @property
     def unidecode_replace(self) -> "UnidecodeReplace":
@@ -58,79 +114,17 @@ class UnidecodeReMatch:
         """
         return self._original
 
-    @staticmethod
-    def _dot_re(s: Optional[str], name: Optional[str] = None) -> str:
-        """
-        Return a subexpression for a regex group to match string `s`.
-
-        For details, see :py:meth:`_get_fake_match`.
-
-        :param s: What the result should match when used as a regular
-            expression. This is generally a string, but it can also be `None`,
-            which results in a group `()??` or `(?P<name>)??` that never
-            matches.
-        :param name: If defined, this is the name for a named group. If
-            omitted, the created regex group remains unnamed.
-        :return: A regex pattern.
-        """
-        if is_none := (s is None):
-            regex = ""
-        else:
-            str_len = len(s)
-            regex = "." * str_len if str_len <= 4 else f".{{{str_len}}}"
-        if name is not None:
-            regex = f"?P<{name}>{regex}"
-        result = f"({regex})"
-        if is_none:
-            result += "??"  # non-greedy, to make sure it matches `None`
-        return result
-
-    def _get_fake_match(self) -> re.Match[str]:
-        """
-        Return a `re.Match` instance to be used with :py:meth:`expand`.
-
-        In :py:meth:`expand`, we need a working `re.Match` instance, but
-        populated from `self.unidecode_replace.string`. The one that we have
-        came from its unidecoded version, so its groups might have unidecoded
-        values instead of the original ones.
-
-        However, populating one manually does not seem possible. So, this
-        method is used to create a fake regular expression and a string that,
-        when matched, result in a `re.Match` instance populated in the way that
-        :py:meth:`expand` requires.
-        """
-        groups = self.groups()
-        regex = ""
-        string = ""
-        gr_idx = 0
-        for name, value in self.groupdict().items():
-            while True:
-                gr_value = groups[gr_idx]
-                gr_idx += 1
-                string += _nnstr(gr_value)
-                if value == gr_value:
-                    regex += self._dot_re(gr_value, name)
-                    break
-                else:
-                    regex += self._dot_re(gr_value)
-        while gr_idx < len(groups):
-            gr_value = groups[gr_idx]
-            regex += self._dot_re(gr_value)
-            string += _nnstr(gr_value)
-            gr_idx += 1
-        result = re.match(f"{regex}$", string)
-        if result is None:
-            raise RuntimeError(  # pragma: no cover
-                f"BUG: invalid regex {repr(regex)} for string {repr(string)}",
-            )
-        else:
-            return result
-
     def expand(self, /, template: str) -> str:
         """
         Unidecode-compatible version of :py:meth:`re.Match.expand`.
         """
-        return self._get_fake_match().expand(template)
+        marked, base = _parse_template(self.re, template)
+        return marked.translate(
+            {
+                base + idx: "" if value is None else value
+                for idx, value in enumerate((self[0],) + self.groups())
+            },
+        )
 
     def group(
         self, *groups: int | str,
@@ -138,66 +132,92 @@ class UnidecodeReMatch:
         """
         Unidecode-compatible version of :py:meth:`re.Match.group`.
         """
-        result = tuple(
-            self.string[start:end] if start >= 0 and end >= 0 else None
-            for start, end in (
-                (self.start(group), self.end(group)) for group in groups
-            )
-        )
-        return result[0] if len(result) == 1 else result
+        if len(groups) == 1:
+            return self._group(groups[0])
+        return tuple(self._group(group) for group in groups)
+
+    def _group(self, group: int | str) -> Optional[str]:
+        """
+        Return the original string's part matched by a single `group`.
+        """
+        start, end = self.span(group)
+        return self.string[start:end] if start >= 0 and end >= 0 else None
 
     def __getitem__(self, g: int | str) -> Optional[str]:
         """
         Return `self.group(g)`.
         """
-        return cast(Optional[str], self.group(g))
+        return self._group(g)
 
     def groups(self, default: _T = None) -> tuple[Optional[str | _T], ...]:
         """
         Unidecode-compatible version of :py:meth:`re.Match.groups`.
         """
-        return tuple(
-            # value cannot be a tuple because we don't call `group(...)` with
-            # multiple names.
-            default if value is None else cast(str, value)
-            for value in (
-                self.group(group_idx)
-                for group_idx in range(1, len(self.original.groups()) + 1)
+        if self._groups is None:
+            self._groups = tuple(
+                self._group(group_idx)
+                for group_idx in range(1, self.re.groups + 1)
             )
+        if default is None:
+            return self._groups
+        return tuple(
+            default if value is None else value for value in self._groups
         )
 
     def groupdict(self, default: _T = None) -> dict[str, Optional[str | _T]]:
         """
         Unidecode-compatible version of :py:meth:`re.Match.groupdict`.
         """
+        if self._groupdict is None:
+            self._groupdict = {
+                name: self._group(name) for name in self.re.groupindex
+            }
         return {
-            # value cannot be a tuple because we don't call `group(...)` with
-            # multiple names.
-            name: default if value is None else cast(Optional[str], value)
-            for name, value in (
-                (name, self.group(name)) for name in self.original.groupdict()
-            )
+            name: default if value is None else value
+            for name, value in self._groupdict.items()
         }
 
     def start(self, group: int | str = 0) -> int:
         """
         Unidecode-compatible version of :py:meth:`re.Match.start`.
         """
-        u_start = self.original.start(group)
-        return -1 if u_start < 0 else self.unidecode_replace.u2i[u_start]
+        return self.span(group)[0]
 
     def end(self, group: int | str = 0) -> int:
         """
         Unidecode-compatible version of :py:meth:`re.Match.end`.
         """
-        u_end = self.original.end(group)
-        return -1 if u_end < 0 else self.unidecode_replace.u2i[u_end]
+        return self.span(group)[1]
 
     def span(self, group: int | str = 0) -> tuple[int, int]:
         """
-        Unidecode-compatible version of :py:meth:`re.Match.end`.
+        Unidecode-compatible version of :py:meth:`re.Match.span`.
+
+        A group that starts or ends inside a chunk (e.g., `"s"` in `"ss"`,
+        which is the unidecoded `"ß"`) is widened to all the original
+        characters that it touches, because a part of a character cannot be
+        matched in the original string.
         """
-        return (self.start(group), self.end(group))
+        try:
+            return self._spans[group]
+        except KeyError:
+            pass
+        u_start, u_end = self._original.span(group)
+        if u_start < 0:
+            result = (-1, -1)
+        else:
+            u2i = self._u2i
+            start = u2i[u_start]
+            end = u2i[u_end]
+            if start < 0 or end < 0:
+                i2u = self.unidecode_replace.i2u
+                if start < 0:
+                    start = bisect.bisect_right(i2u, u_start) - 1
+                if end < 0:
+                    end = bisect.bisect_left(i2u, u_end)
+            result = (start, end)
+        self._spans[group] = result
+        return result
 
     @property
     def pos(self) -> int:
@@ -2,14 +2,22 @@
 Unidecode-compatible string replacing.
 """
 
-from copy import deepcopy
+from array import array
+import functools
+import heapq
 import itertools
+import operator
 import re
-from typing import cast, TypeAlias, Callable, Sequence, Any, Optional
+from typing import (
+    cast, TypeAlias, Callable, Sequence, Any, Optional, Iterator,
+)
+import warnings
 
 from .match import UnidecodeReMatch
-from .replicas import unidecode_repl
-from .search_item import SearchItem, get_search_item
+from .replicas import bulk_unidecode
+from .search_item import (
+    SearchItem, SearchItemStr, get_search_item, lower_same_length,
+)
 
 
 SimpleSearchT: TypeAlias = str | re.Pattern
@@ -19,22 +27,122 @@ SimpleSubT: TypeAlias = (
 )
 NormalizedSubT: TypeAlias = list[SimpleSubT]
 SubT: TypeAlias = SimpleSubT | Sequence[SimpleSubT]
-u2iT: TypeAlias = dict[int, int]
+u2iT: TypeAlias = Sequence[int]
+_SearchHeapT: TypeAlias = list[tuple[int, int, SearchItem]]
+_CombinedMatchesT: TypeAlias = Callable[
+    [re.Match], Iterator[tuple[SearchItem, re.Match]]
+]
+_TrieT: TypeAlias = dict[Optional[str], Any]
+
+
+# Patterns that may contain references to groups (backreferences and
+# conditionals), which would refer to wrong groups in a combined pattern. This
+# is intentionally overcautious, as the only price of a false positive is not
+# combining patterns.
+_GROUP_REF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Flags that can be applied to a part of a pattern, with their inline letters.
+_SCOPED_FLAGS = {re.I: "i", re.M: "m", re.S: "s"}
+_SCOPED_FLAGS_MASK = functools.reduce(operator.or_, _SCOPED_FLAGS)
+
+
+def _scoped_pattern(pattern: str, flags: int) -> str:
+    """
+    Return `pattern` wrapped so that it uses scoped `flags` (if there are any).
+    """
+    letters = "".join(
+        letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag
+    )
+    return f"(?{letters}:{pattern})" if letters else pattern
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_combined(
+    patterns: tuple[tuple[str, int], ...], flags: int,
+) -> Optional[re.Pattern]:
+    """
+    Return a single regex matching any of `patterns`, or `None` if impossible.
 
+    Each of the patterns is wrapped in a group of its own, so that the index of
+    the last matched group (`re.Match.lastindex`) identifies the pattern that
+    matched.
 
-class _NoUnidecodingDict(u2iT):
+    :param patterns: A tuple of pairs `(pattern, scoped_flags)`, where
+        `scoped_flags` are applied only to `pattern`.
+    :param flags: Flags applied to the whole combined pattern.
     """
-    Dictionary that returns the value of the key for missing keys.
+    if any(_GROUP_REF_RE.search(pattern) for pattern, _ in patterns):
+        return None
+    # In verbose patterns, a trailing comment would also comment out whatever
+    # follows the pattern in the combined one, so it is ended by a newline.
+    end = "\n" if flags & re.X else ""
+    with warnings.catch_warnings():
+        # Python 3.10 only warns about global flags not at the start.
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return re.compile(
+                "|".join(
+                    f"({_scoped_pattern(pattern + end, scoped_flags)})"
+                    for pattern, scoped_flags in patterns
+                ),
+                flags=flags,
+            )
+        except (re.error, DeprecationWarning):
+            return None
 
-    This is used to mimic `u2i` for non-unidecoded strings (when
-    `unidecoded_search` in `UnidecodeReplace` is set to `False`).
+
+def _trie_pattern(node: _TrieT) -> str:
     """
+    Return a regex (without groups) matching the strings in trie `node`.
 
-    def __missing__(self, key: int) -> int:
-        return key
+    Chains of nodes with only one child each are merged into a single literal,
+    so that the nesting of the regex stays shallow.
+    """
+    alternatives = list()
+    for char, child in node.items():
+        if char is None:
+            continue
+        chars = [char]
+        while len(child) == 1 and None not in child:
+            ((char, child),) = child.items()
+            chars.append(char)
+        alternatives.append(re.escape("".join(chars)) + _trie_pattern(child))
+    if not alternatives:
+        return ""
+    pattern = (
+        alternatives[0]
+        if len(alternatives) == 1 else
+        f"(?:{'|'.join(alternatives)})"
+    )
+    return f"(?:{pattern})?" if None in node else pattern
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_trie(
+    needles: tuple[str, ...],
+) -> Optional[tuple[re.Pattern, _TrieT]]:
+    """
+    Return a single regex matching any of `needles` and a trie of them.
 
-    def __contains__(self, key: object) -> bool:
-        return True  # The length of `string` is ignored.
+    Unlike an alternation of all the `needles`, the regex shares the work for
+    their common prefixes, which makes a huge difference for many needles.
+    It has no groups, so the needles that match are found by walking the
+    trie, in which the item with key `None` of a node lists the indices of
+    the needles ending there.
+
+    :return: A tuple `(regex, trie)`, or `None` if the regex is too deeply
+        nested to be compiled.
+    """
+    trie: _TrieT = dict()
+    for idx, needle in enumerate(needles):
+        node = trie
+        for char in needle:
+            node = node.setdefault(char, dict())
+        node.setdefault(None, list()).append(idx)
+    try:
+        return re.compile(_trie_pattern(trie)), trie
+    except (re.error, RecursionError):
+        return None
 
 
 class UnidecodeReplace:
@@ -70,10 +178,20 @@ class UnidecodeReplace:
         )
         self.unidecoded_search = unidecoded_search
         self.str_case_sensitive = str_case_sensitive
-
-        self.search_items = self._get_search_items()
-        self.u2i, self.uni_str, self.uni_str_lower = self._get_unis()
-        self._init_search_items()
+        # ASCII strings unidecode to themselves, one character per character,
+        # so they need no unidecoding either. This makes `u2i` an identity
+        # mapping, known in advance (i.e., before the search items are made).
+        self.trivial_u2i = not unidecoded_search or string.isascii()
+
+        # All the search items, in the same order as the searches in
+        # `self.search` (unlike `search_items`, see there).
+        self._all_search_items = self._get_search_items()
+        self._search_items: Optional[list[SearchItem]] = None
+        (
+            self.u2i, self.u2i_keys, self.i2u, self.uni_str,
+            self.uni_str_lower,
+        ) = self._get_unis()
+        self.combined_search = self._get_combined_search()
 
     def _get_search_items(self) -> list[SearchItem]:
         """
@@ -86,18 +204,19 @@ class UnidecodeReplace:
             return isinstance(obj, Sequence) and not isinstance(obj, str)
 
         # Make sure that they are lists (and also copies of originals, not just
-        # references).
+        # references). Shallow copies are enough, because the items themselves
+        # (strings, regex patterns, and callables) are never modified.
         search = (
-            list(deepcopy(self.search))  # type: ignore
+            list(self.search)  # type: ignore
             if is_proper_sequence(self.search) else
-            [deepcopy(self.search)]  # type: ignore
+            [self.search]
         )
         sub = cast(
             NormalizedSubT,
             (
-                list(deepcopy(self.sub))  # type: ignore
+                list(self.sub)  # type: ignore
                 if is_proper_sequence(self.sub) else
-                [deepcopy(self.sub)]
+                [self.sub]
             ),
         )
 
@@ -135,16 +254,110 @@ class UnidecodeReplace:
 
         return result
 
+    def _get_combined_search(
+        self,
+    ) -> Optional[tuple[re.Pattern, _CombinedMatchesT]]:
+        """
+        Return a combined search regex, if all the searches can be combined.
+
+        Searching for multiple regexes at once is done by a single regex
+        alternation, which lets the regex engine do the work in one pass
+        instead of scheduling the searches one by one. Search strings take
+        part as regexes matching them literally. This is possible if all the
+        searches are done in the same string and overlaps are not allowed.
+        Flags that differ between the regexes are applied to each of them as
+        scoped flags. Multiple search strings are combined into a trie-based
+        regex instead (see :py:func:`_compile_trie`).
+
+        :return: `None` if the searches cannot be combined, or a tuple of the
+            combined regex and a function that yields the search items (and
+            their matches) that matched where the combined regex did (see
+            :py:meth:`_combined_matches`).
+        """
+        search_items = self._all_search_items
+        uni_str = search_items[0].uni_str
+        if self.allow_overlaps or not all(
+            search_item.uni_str is uni_str for search_item in search_items
+        ):
+            return None
+
+        patterns = [search_item.search_re for search_item in search_items]
+        if len(patterns) == 1:
+            return patterns[0], functools.partial(
+                self._combined_matches, groups=dict(),
+            )
+
+        if all(
+            isinstance(search_item, SearchItemStr)
+            for search_item in search_items
+        ):
+            compiled_trie = _compile_trie(
+                tuple(
+                    cast(str, search_item.search)
+                    for search_item in search_items
+                ),
+            )
+            if compiled_trie is not None:
+                trie_re, trie = compiled_trie
+                return trie_re, functools.partial(
+                    self._trie_matches, trie=trie,
+                )
+
+        flags = patterns[0].flags
+        if all(pattern.flags == flags for pattern in patterns):
+            scoped_patterns = tuple(
+                (str(pattern.pattern), 0) for pattern in patterns
+            )
+        else:
+            flags &= ~_SCOPED_FLAGS_MASK
+            if any(
+                pattern.flags & ~_SCOPED_FLAGS_MASK != flags
+                for pattern in patterns
+            ):
+                return None
+            scoped_patterns = tuple(
+                (str(pattern.pattern), pattern.flags & _SCOPED_FLAGS_MASK)
+                for pattern in patterns
+            )
+
+        combined = _compile_combined(scoped_patterns, flags)
+        if combined is None:
+            return None
+
+        group_idx = 1
+        groups = dict()
+        for si_idx, pattern in enumerate(patterns):
+            groups[group_idx] = si_idx
+            group_idx += pattern.groups + 1
+
+        return combined, functools.partial(
+            self._combined_matches, groups=groups,
+        )
+
+    @property
+    def search_items(self) -> list[SearchItem]:
+        """
+        Return the search items that have matches.
+
+        The search items are positioned at their first matches and ordered as
+        the searches in `self.search`. The combined search (see
+        :py:meth:`_get_combined_search`) doesn't use them, so they are
+        initialized on the first access.
+        """
+        if self._search_items is None:
+            self._init_search_items()
+        return cast(list[SearchItem], self._search_items)
+
     def _init_search_items(self) -> None:
         """
         Initialize search items.
         """
-        for search_item in self.search_items:
+        for search_item in self._all_search_items:
             search_item.reset_search()
 
-        self.search_items[:] = [
+        self._search_items = [
             search_item
-            for search_item in self.search_items
+            for search_item in self._all_search_items
             if search_item.next() >= 0
         ]
 
@@ -153,7 +366,8 @@ class UnidecodeReplace:
         Return `True` if any of the searches is case-sensitive.
         """
         return any(
-            search_item.case_sensitive for search_item in self.search_items
+            search_item.case_sensitive
+            for search_item in self._all_search_items
         )
 
     def _case_insensitive_needed(self) -> bool:
@@ -161,74 +375,231 @@ class UnidecodeReplace:
         Return `True` if any of the searches is case-insensitive.
         """
         return any(
-            not search_item.case_sensitive for search_item in self.search_items
+            not search_item.case_sensitive
+            for search_item in self._all_search_items
         )
 
-    def _get_unis(self) -> tuple[u2iT, Optional[str], Optional[str]]:
+    def _get_unis(
+        self,
+    ) -> tuple[u2iT, u2iT, u2iT, Optional[str], Optional[str]]:
         """
-        Return `u2i` mapping, plus search versions of `self.string`.
+        Return `u2i` mapping, its keys, its inverse, and search versions of
+        `self.string`.
 
         The `u2i` mapping is a mapping of indexes from unidecoded string to the
         original one (`self.string`). This is needed because searching is done
         on the unidecoded string, while the replacing is supposed to be done on
-        the original one.
+        the original one. It is a sequence with an item for each index of the
+        unidecoded string (plus one for its end), holding the index in the
+        original string if a character's unidecoded chunk starts there, or -1
+        if the index is inside a chunk.
+
+        The keys of `u2i` are the indexes at which the chunks start (i.e., the
+        ones mapped to non-negative values), in ascending order.
+
+        The inverse `i2u` holds, for each index of the original string (plus
+        one for its end), the index in the unidecoded string at which its
+        chunk starts. This is also the first key of `u2i` mapped to that index
+        or a greater one.
 
         The two strings are unidecoded (or not, depending on
         `self.unidecoded_search`) and lowercase version of that if any of the
         searches require case-insensitive search.
         """
         def cased_result(
-            u2i: u2iT, uni_str: str,
-        ) -> tuple[u2iT, Optional[str], Optional[str]]:
+            u2i: u2iT, u2i_keys: u2iT, i2u: u2iT, uni_str: str,
+        ) -> tuple[u2iT, u2iT, u2iT, Optional[str], Optional[str]]:
             if self._case_sensitive_needed() and self.unidecoded_search:
                 result_uni_str = uni_str
             else:
                 result_uni_str = None
             if self._case_insensitive_needed():
-                result_uni_str_lower = uni_str.lower()
+                result_uni_str_lower = lower_same_length(uni_str)
             else:
                 result_uni_str_lower = None
-            return u2i, result_uni_str, result_uni_str_lower
+            return u2i, u2i_keys, i2u, result_uni_str, result_uni_str_lower
+
+        # For the identity mapping, `range` is a cheap (C-level) `u2i`.
+        if self.trivial_u2i:
+            identity = range(len(self.string) + 1)
+            return cased_result(identity, identity, identity, self.string)
 
-        if not self.unidecoded_search:
-            return cased_result(_NoUnidecodingDict(), self.string)
+        # Unidecoded string and the lengths of the unidecoded chunks, one for
+        # each character of the original string.
+        uni_str, lengths = bulk_unidecode(self.string)
 
-        uni_str = self.string
+        # If every character unidecodes to exactly one character (common for
+        # texts in Latin scripts with diacritics), the mapping is still the
+        # identity, and the check is done by C-level `array.count`.
+        if lengths.count(1) == len(lengths):
+            identity = range(len(self.string) + 1)
+            return cased_result(identity, identity, identity, uni_str)
 
-        # Unidecoded string as a list of unidecoded chunks to be merged.
-        unidecoded_list = list(unidecode_repl(uni_str, "preserve"))
+        # The inverse mapping (see above), i.e., the starts of the chunks.
+        i2u = array("i", itertools.accumulate(lengths, initial=0))
 
         # Mapping for unidecoded indexes to original ones ("unidecoded 2
-        # index").
-        u2i = dict(
-            zip(
-                itertools.accumulate(
-                    (len(uni_str) for uni_str in unidecoded_list),
-                    initial=0,
-                ),
-                range(len(unidecoded_list) + 1),
-            ),
-        )
+        # index"). Characters that unidecode to empty strings share their
+        # index with the next character, in which case the latter wins.
+        u2i = array("i", [-1]) * (len(uni_str) + 1)
+        for idx, u_idx in enumerate(i2u):
+            u2i[u_idx] = idx
+
+        # Shared starts (of empty chunks) are listed once. Without empty
+        # chunks (checked by C-level `array.count`), the starts are all
+        # distinct and the costly deduplication is skipped.
+        if lengths.count(0):
+            u2i_keys = array("i", dict.fromkeys(i2u))
+        else:
+            u2i_keys = i2u
+        return cased_result(u2i, u2i_keys, i2u, uni_str)
 
-        # This is really just `unidecode(string)`, but we couldn't call it
-        # directly as we needed the intermediate step as the list used for
-        # `u2i` above.
-        uni_str = "".join(unidecoded_list)
+    @staticmethod
+    def _advance_search_item(
+        heap: _SearchHeapT, search_item: SearchItem, found: bool,
+    ) -> None:
+        """
+        Update the top of the heap with `search_item` after moving it.
 
-        return cased_result(u2i, uni_str)
+        :param heap: A heap of search items, with `search_item` on the top.
+        :param search_item: The search item that was moved.
+        :param found: `True` if `search_item` is at a new match, or `False` if
+            it has no more matches (in which case it is removed).
+        """
+        if found:
+            heapq.heapreplace(heap, (search_item.pos, heap[0][1], search_item))
+        else:
+            heapq.heappop(heap)
 
-    @staticmethod
-    def _skip_overlaps(search_items: list[SearchItem], last_pos: int) -> None:
+    def _skip_overlaps(self, heap: _SearchHeapT, last_pos: int) -> None:
         """
         Reposition search items' `pos` after an overlap and remove spent ones.
+
+        The items that had to be repositioned are searched again from their
+        new positions, as those are not necessarily positions of a match. Only
+        the items on top of the heap need to be checked, because the positions
+        of the others are not smaller than theirs.
         """
-        to_remove = [
-            idx
-            for idx, search_item in enumerate(search_items)
-            if search_item.get_next_pos(min_ipos=last_pos) == -1
-        ]
-        for idx in to_remove[::-1]:
-            del search_items[idx]
+        while heap:
+            old_pos, _, search_item = heap[0]
+            new_pos = search_item.get_next_pos(min_ipos=last_pos)
+            if new_pos == old_pos:
+                break
+            self._advance_search_item(
+                heap, search_item, new_pos >= 0 and search_item.next() >= 0,
+            )
+
+    def _get_u_pos(self, pos: int) -> int:
+        """
+        Return the unidecoded index from which to search for matches at `pos`.
+
+        This is the index of the chunk for `self.string[pos]` (or the end of
+        the unidecoded string if `pos` is past the end of `self.string`).
+        """
+        return self.i2u[max(0, min(pos, len(self.string)))]
+
+    def _combined_matches(
+        self, uni_m: re.Match, groups: dict[int, int],
+    ) -> Iterator[tuple[SearchItem, re.Match]]:
+        """
+        Yield search items and their matches at the start of `uni_m`.
+
+        The first one is the search item whose regex matched in the combined
+        one (i.e., `uni_m`), followed by the subsequent search items whose
+        regexes also match at the same position, in the same order in which
+        they appear in `self.search`.
+        """
+        search_items = self._all_search_items
+        if not groups:
+            yield search_items[0], uni_m
+            return
+
+        start = uni_m.start()
+        uni_str = search_items[0].uni_str
+        for search_item in search_items[groups[cast(int, uni_m.lastindex)]:]:
+            item_m = search_item.search_re.match(uni_str, start)
+            if item_m is not None:
+                yield search_item, item_m
+
+    def _trie_matches(
+        self, uni_m: re.Match, trie: _TrieT,
+    ) -> Iterator[tuple[SearchItem, re.Match]]:
+        """
+        Yield search items and their matches at the start of `uni_m`.
+
+        This is :py:meth:`_combined_matches` for search strings combined by
+        :py:func:`_compile_trie`. The search items are found by walking the
+        `trie` from the start of `uni_m`.
+        """
+        search_items = self._all_search_items
+        start = uni_m.start()
+        uni_str = search_items[0].uni_str
+        si_indices = list()
+        node: Optional[_TrieT] = trie
+        for u_idx in range(start, len(uni_str)):
+            node = cast(_TrieT, node).get(uni_str[u_idx])
+            if node is None:
+                break
+            si_indices.extend(node.get(None, ()))
+        for si_idx in sorted(si_indices):
+            search_item = search_items[si_idx]
+            yield search_item, cast(
+                re.Match, search_item.search_re.match(uni_str, start),
+            )
+
+    def _run_combined(
+        self, combined: re.Pattern, combined_matches: _CombinedMatchesT,
+    ) -> str:
+        """
+        Return `string` with replacements found by the combined search regex.
+
+        This is a faster equivalent of the generic search in :py:meth:`run`,
+        used when all the searches can be combined into one regex.
+        """
+        # The loop below runs once per candidate match, so everything it needs
+        # is bound to local names.
+        string = self.string
+        endpos = self.endpos
+        u2i = self.u2i
+        search = combined.search
+        uni_str = self._all_search_items[0].uni_str
+        # Negative if there is no limit (i.e., it never drops to zero).
+        matches_left = -1 if self.count is None else self.count
+
+        parts: list[str] = list()
+        append = parts.append
+        last_pos = 0
+        min_start = max(0, self.pos)
+        u_pos = self._get_u_pos(min_start)
+        while (uni_m := search(uni_str, u_pos)) is not None:
+            u_start = uni_m.start()
+            start = u2i[u_start]
+            if start >= endpos:
+                break
+            u_pos = u_start + 1
+            if start < min_start:
+                # Either inside a unidecoded chunk or before `self.pos`.
+                continue
+            for search_item, item_m in combined_matches(uni_m):
+                if u2i[item_m.end()] >= 0:
+                    break
+            else:
+                continue
+
+            search_item.set_match(item_m)
+            pos, next_pos = search_item.get_start_end()
+            if last_pos < pos:
+                # Adjacent matches have nothing to copy in between.
+                append(string[last_pos:pos])
+            append(search_item.get_replace())
+            last_pos = next_pos
+            u_pos = item_m.end()
+            matches_left -= 1
+            if not matches_left:
+                break
+
+        append(string[last_pos:])
+        return "".join(parts)
 
     def run(self) -> str:
         """
@@ -240,30 +611,51 @@ class UnidecodeReplace:
         if not (count is None or (isinstance(count, int) and count > 0)):
             raise ValueError("count must be None or a positive integer")
 
-        result = ""
+        if self.combined_search is not None:
+            return self._run_combined(*self.combined_search)
+
+        # Search items ordered by their positions (and their order in
+        # `self.search_items` for the same positions).
+        heap = [
+            (search_item.pos, si_idx, search_item)
+            for si_idx, search_item in enumerate(self.search_items)
+        ]
+        heapq.heapify(heap)
+
+        # The loop below runs once per match, so everything it needs is bound
+        # to local names.
+        string = self.string
+        allow_overlaps = self.allow_overlaps
+        advance_search_item = self._advance_search_item
+        # Negative if there is no limit (i.e., it never drops to zero).
+        matches_left = -1 if count is None else count
+
+        parts: list[str] = list()
+        append = parts.append
         last_pos = 0
-        matches = 0
-        while self.search_items:
-            si_idx, search_item = min(
-                enumerate(self.search_items), key=lambda item: item[1].pos,
-            )
+        while heap:
+            search_item = heap[0][2]
             pos, next_pos = search_item.get_start_end()
-            if pos >= last_pos or self.allow_overlaps:
-                if last_pos > pos:
-                    pos = last_pos
-                sub = search_item.get_replace()
-                result = f"{result}{self.string[last_pos:pos]}{sub}"
-                last_pos = next_pos
-                if count is not None:
-                    matches += 1
-                    if matches >= count:
-                        break
-                if self.allow_overlaps:
-                    search_item.get_next_pos(min_ipos=pos + 1)
-                else:
-                    self._skip_overlaps(self.search_items, last_pos)
-            if search_item.next() < 0:
-                del self.search_items[si_idx]
-            pos = last_pos
-        result = f"{result}{self.string[last_pos:]}"
-        return result
+            if last_pos < pos:
+                append(string[last_pos:pos])
+            else:
+                pos = last_pos
+            append(search_item.get_replace())
+            last_pos = next_pos
+            matches_left -= 1
+            if not matches_left:
+                break
+            if allow_overlaps:
+                advance_search_item(
+                    heap,
+                    search_item,
+                    (
+                        search_item.get_next_pos(min_ipos=pos + 1) >= 0
+                        and search_item.next() >= 0
+                    ),
+                )
+            else:
+                # This also moves `search_item` past the replaced part.
+                self._skip_overlaps(heap, last_pos)
+        append(string[last_pos:])
+        return "".join(parts)
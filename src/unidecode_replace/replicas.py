@@ -2,16 +2,16 @@
 Functions that replicate internal functionality needed from `unidecode`.
 """
 
-from typing import TypeAlias, Literal, Iterator
+from array import array
+import functools
 import warnings
 
-from unidecode import UnidecodeError, Cache
+from unidecode import Cache
 
 
-ErrorsType: TypeAlias = Literal["ignore", "strict", "replace", "preserve"]
-
-
-# Copy/paste (with minor code style changes) from unidecode==1.2.0.
+# Copy/paste (with minor code style changes) from unidecode==1.2.0, memoized
+# because real texts tend to repeat a relatively small set of characters.
+@functools.lru_cache(maxsize=65536)
 def _get_repl_str(char):
     codepoint = ord(char)
 
@@ -57,66 +57,42 @@ def _get_repl_str(char):
         return None
 
 
-def _unidecode_repl_char(
-    index: int, char: str, errors: "ErrorsType", replace_str: str,
-) -> str:
-    """
-    Return replacement string for `char` and position `index`.
-
-    For arguments other than `index`, check :py:func:`unidecode.unidecode`.
+def bulk_unidecode(string: str) -> tuple[str, "array[int]"]:
     """
-    repl = _get_repl_str(char)
-
-    if repl is None:
-        if errors == 'ignore':
-            repl = ''
-        elif errors == 'strict':
-            raise UnidecodeError(
-                'no replacement found for character %r in position %d' % (
-                    char, index,
-                ),
-                index,
-            )
-        elif errors == 'replace':
-            repl = replace_str
-        elif errors == 'preserve':
-            repl = char
-        else:
-            raise UnidecodeError(
-                'invalid value for errors parameter %r' % errors,
-            )
+    Return unidecoded `string` and the lengths of its per-character chunks.
 
-    return repl
+    The unidecoding is done as with `errors="preserve"`, i.e., characters
+    without a replacement are kept as they are. Each distinct character is
+    resolved only once, while the per-character work is done by C-level
+    `map`, `str.join`, and `array` instead of a Python generator.
 
-
-def unidecode_repl(
-    string: str, errors: "ErrorsType" = "ignore",
-    replace_str: str = "?",
-) -> Iterator[str]:
-    """
-    Return a generator with chunks replacing the characters in `string`.
+    :param string: The string to unidecode.
+    :return: A tuple `(uni_str, lengths)`, where `uni_str` is the unidecoded
+        `string` and `lengths[i]` is the length of the replacement of
+        `string[i]` in `uni_str`.
     """
-    return (
-        _unidecode_repl_char(index, char, errors, replace_str)
-        for index, char in enumerate(string)
-    )
+    table = dict()
+    for char in set(string):
+        repl = _get_repl_str(char)
+        table[char] = char if repl is None else repl
+    chunks = list(map(table.__getitem__, string))
+    return "".join(chunks), array("i", map(len, chunks))
 
 
 def can_be_unidecoded(string: str) -> bool:
     """
     Return `True` if the `string` can be unidecoded without errors.
     """
-    try:
-        for _ in unidecode_repl(string, "strict", "?"):
-            pass
-    except UnidecodeError:
-        return False
-    else:
+    if string.isascii():
         return True
+    return all(
+        char < "\x80" or _get_repl_str(char) is not None
+        for char in set(string)
+    )
 
 
 def get_invalid_chars(string: str) -> set[str]:
     """
     Return a set of chars in `string` that fail to unidecode.
     """
-    return {char for char in string if not can_be_unidecoded(char)}
+    return {char for char in set(string) if _get_repl_str(char) is None}
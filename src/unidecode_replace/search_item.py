@@ -6,8 +6,10 @@ purpose is internal and they should not be used outside of the package.
 """
 
 import abc
+import bisect
+import functools
 import re
-from typing import TYPE_CHECKING, Optional, cast, Iterator
+from typing import TYPE_CHECKING, Callable, Optional, cast, Iterator
 
 from unidecode import unidecode
 
@@ -20,6 +22,84 @@ if TYPE_CHECKING:
     )
 
 
+# Characters with lowercase versions longer than one character (only "İ",
+# lowercased to "i" and a combining dot), mapped to the first character of
+# their lowercase versions.
+_LOWER_SAME_LENGTH = str.maketrans({"\u0130": "i"})
+
+
+def lower_same_length(string: str) -> str:
+    """
+    Return `string.lower()`, but always of the same length as `string`.
+
+    The lowercase versions of strings are searched instead of the strings
+    themselves, so the indexes in them have to match. `str.lower` is kept
+    for all the other characters, as it is much faster than `str.translate`,
+    and the rare strings that need fixing are detected by their lengths.
+    """
+    result = string.lower()
+    if len(result) != len(string):
+        result = string.translate(_LOWER_SAME_LENGTH).lower()
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare_search_str(
+    one_search: str, str_case_sensitive: bool, unidecoded_search: bool,
+) -> str:
+    """
+    Return search string `one_search` prepared for searching.
+
+    The result is cached, so that repeated calls with the same searches do not
+    redo the lowercasing and unidecoding.
+    """
+    if not str_case_sensitive:
+        one_search = lower_same_length(one_search)
+    if unidecoded_search:
+        one_search = unidecode(one_search)
+    if not one_search:
+        raise ValueError("search strings must not be empty")
+    return one_search
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_search_str(search_str: str) -> re.Pattern:
+    """
+    Return a regex matching (prepared) search string `search_str` literally.
+    """
+    return re.compile(re.escape(search_str))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_re(pattern: str, re_flags: re.RegexFlag) -> re.Pattern:
+    """
+    Return `pattern` compiled with `re_flags`.
+
+    This is `re.compile` with a cache that is faster to hit than the one in
+    `re`, for string searches that are turned into regexes.
+    """
+    return re.compile(pattern, flags=re_flags)
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare_search_regex(
+    one_search: str, re_flags: re.RegexFlag, unidecoded_search: bool,
+) -> re.Pattern:
+    """
+    Return search pattern `one_search` prepared and compiled for searching.
+
+    The result is cached, so that repeated calls with the same searches do not
+    redo the unidecoding, validation, and compiling of the pattern.
+    """
+    if unidecoded_search:
+        one_search = unidecode(one_search)
+
+    result = re.compile(one_search, flags=re_flags)
+    if result.fullmatch("") is not None:
+        raise ValueError("search patterns must not match empty strings")
+    return result
+
+
 class SearchItem(abc.ABC):
     """
     One search item.
@@ -37,9 +117,43 @@ class SearchItem(abc.ABC):
         if not (isinstance(one_sub, str) or callable(one_sub)):
             raise TypeError("sub must be strings or callables")
         self.sub = one_sub
+        # Return the string that should replace currently found substring.
+        # This is called for every replacement, so it is bound to the
+        # implementation for the type of `one_sub` here, once.
+        self.get_replace: Callable[[], str] = (
+            self._get_replace_str
+            if isinstance(one_sub, str) else
+            self._get_replace_callable
+        )
+        # The name of `unidecode_replace`'s attribute holding the string that
+        # is searched (see `uni_str`). It is known here, but the string itself
+        # is created later.
+        self._uni_str_attr = (
+            ("uni_str" if unidecode_replace.unidecoded_search else "string")
+            if self.case_sensitive else
+            "uni_str_lower"
+        )
 
         self._pos = -1
-        self._pos_iter: Optional[Iterator[int]] = None
+        # Index of the first of `unidecode_replace.u2i_keys` after `self._pos`.
+        self._pos_idx = 0
+        # A persistent iterator over the matches and the position from which
+        # it continues its search (see `_search`).
+        self._matches: Optional[Iterator[re.Match]] = None
+        self._matches_pos = 0
+        # Perform search and return the next value for `self.pos`. This is
+        # called for every match, so it is bound to the implementation that
+        # doesn't check whether the search item is positioned as soon as it
+        # is (see `_next_first`).
+        self.next: Callable[[], int] = self._next_first
+
+    @property
+    @abc.abstractmethod
+    def search_re(self) -> re.Pattern:
+        """
+        Return the regex used to find the matches in `self.uni_str`.
+        """
+        raise NotImplementedError()  # pragma: no cover
 
     @property
     @abc.abstractmethod
@@ -51,18 +165,10 @@ class SearchItem(abc.ABC):
 
     @property
     def uni_str(self) -> str:
-        result = (
-            (
-                self.unidecode_replace.uni_str
-                if self.unidecode_replace.unidecoded_search else
-                self.unidecode_replace.string
-            )
-            if self.case_sensitive else
-            self.unidecode_replace.uni_str_lower
-        )
+        result = getattr(self.unidecode_replace, self._uni_str_attr)
         if result is None:
             raise RuntimeError(  # pragma: no cover
-                "BUG: uni_str was not created for {repr(self)}",
+                f"BUG: uni_str was not created for {repr(self)}",
             )
         else:
             return result
@@ -72,11 +178,10 @@ class SearchItem(abc.ABC):
         Reset attributes related to the current search position.
         """
         self._pos = -1
-        self._pos_iter = (
-            iter(self.unidecode_replace.u2i.keys())
-            if self.unidecode_replace.unidecoded_search else
-            None
-        )
+        self._pos_idx = 0
+        self._matches = None
+        self._matches_pos = 0
+        self.next = self._next_first
         return -1
 
     def __repr__(self):
@@ -101,38 +206,63 @@ class SearchItem(abc.ABC):
         """
         Find and return the next viable value for `self.pos`.
         """
-        def pos_is_good():
-            return (
-                (min_pos is None or self._pos >= max(0, min_pos))
-                and (min_ipos is None or u2i[self._pos] >= max(0, min_ipos))
-                and (u2i[self._pos] >= self.unidecode_replace.pos)
-            )
+        unidecode_replace = self.unidecode_replace
+        if min_pos is None:
+            min_pos = self._pos + 1 if min_ipos is None else 0
+        min_ipos = max(
+            unidecode_replace.pos, 0 if min_ipos is None else min_ipos,
+        )
+        if min_ipos >= unidecode_replace.endpos:
+            return self.reset_search()
+        # The first key of `u2i` mapped to `min_ipos` or more is given by the
+        # inverse mapping, which turns both limits into one on the keys.
+        return self._advance_to(
+            max(min_pos, unidecode_replace.i2u[min_ipos]),
+        )
 
-        u2i = self.unidecode_replace.u2i
-        endpos = self.unidecode_replace.endpos
+    def _advance_to(self, min_pos: int) -> int:
+        """
+        Move `self.pos` to the first viable position at or after `min_pos`.
 
-        if (min_pos is not None or min_ipos is not None) and pos_is_good():
-            return (
-                self._pos if u2i[self._pos] < endpos else self.reset_search()
-            )
+        This is the part of `get_next_pos` that does the moving, called
+        directly (at least once per candidate match) when `min_pos` is known
+        to satisfy the other limits.
 
-        if self._pos_iter is None:
-            self._pos += 1
-            if self._pos >= len(self.unidecode_replace.string):
-                return self.reset_search()
-            return self._pos
+        :param min_pos: A nonnegative index in the unidecoded string, not
+            before `self.unidecode_replace.pos` (in the original one).
+        :return: The new value of `self.pos`, or -1 if there is none.
+        """
+        unidecode_replace = self.unidecode_replace
+        endpos = unidecode_replace.endpos
+        pos = self._pos
+        if pos >= min_pos:
+            # The current position is always a viable one.
+            if unidecode_replace.u2i[pos] < endpos:
+                return pos
+            return self.reset_search()
 
-        while True:
-            try:
-                self._pos = next(self._pos_iter)
-            except StopIteration:  # pragma: no cover
-                # A failsafe that should not happen. The `if` below should stop
-                # it before we run out of `_pos_iter`.
-                return self.reset_search()
-            if u2i[self._pos] >= endpos:
+        u2i_keys = unidecode_replace.u2i_keys
+        if isinstance(u2i_keys, range):
+            # Every position is a valid one, so we can jump straight to it.
+            if min_pos >= endpos:
                 return self.reset_search()
-            if pos_is_good():
-                return self._pos
+            self._pos = min_pos
+            return min_pos
+
+        # The first key not before `min_pos` is found by bisecting, but it is
+        # usually the very next key, so that one is checked first.
+        idx = self._pos_idx
+        size = len(u2i_keys)
+        if idx < size and u2i_keys[idx] < min_pos:
+            idx = bisect.bisect_left(u2i_keys, min_pos, idx + 1)
+        if idx >= size:
+            return self.reset_search()
+        pos = u2i_keys[idx]
+        if unidecode_replace.u2i[pos] >= endpos:
+            return self.reset_search()
+        self._pos = pos
+        self._pos_idx = idx + 1
+        return pos
 
     @abc.abstractmethod
     def get_start_end(self) -> tuple[int, int]:
@@ -146,6 +276,38 @@ class SearchItem(abc.ABC):
         """
         raise NotImplementedError()  # pragma: no cover
 
+    def _search(self, pos: int) -> Optional[re.Match]:
+        """
+        Return the same as `self.search_re.search(self.uni_str, pos)`.
+
+        Matches are taken from a single `finditer` iterator for as long as
+        `pos` doesn't go back into an area that the iterator has already
+        passed, so that consecutive searches don't restart the regex engine.
+        This works because the first match starting at or after `pos` is
+        also the first match that the iterator yields at or after `pos`,
+        unless the previous match yielded by the iterator ends after `pos`.
+        """
+        matches = self._matches
+        while True:
+            if matches is None or pos < self._matches_pos:
+                matches = self._matches = self.search_re.finditer(
+                    self.uni_str, pos,
+                )
+                self._matches_pos = pos
+            uni_m = next(matches, None)
+            if uni_m is None:
+                return None
+            start, end = uni_m.span()
+            if start == end:
+                # After an empty match, `finditer` doesn't continue from its
+                # end in the way `search` would, so we don't reuse it.
+                self._matches = None
+            else:
+                self._matches_pos = end
+            if start >= pos:
+                return uni_m
+            matches = self._matches
+
     def chunk_ok(self, start: int, end: int) -> bool:
         """
         Return `True` if the `start` and `end` are legitimate positions.
@@ -161,19 +323,54 @@ class SearchItem(abc.ABC):
         method will return `False`.
         """
         u2i = self.unidecode_replace.u2i
-        return start in u2i and end in u2i
+        return u2i[start] >= 0 and u2i[end] >= 0
+
+    @abc.abstractmethod
+    def set_match(self, uni_m: re.Match) -> None:
+        """
+        Make `uni_m`, found in `self.uni_str` by `self.search_re`, the current
+        match.
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    def _next_first(self) -> int:
+        """
+        Perform search and return the next value for `self.pos`.
+
+        This is `next` until the search item is positioned (i.e., initially
+        and after its search is reset). It positions the search item and
+        makes `_next_positioned` the `next` from then on.
+        """
+        if self._pos < 0 and self.get_next_pos() < 0:
+            return -1
+        self.next = self._next_positioned
+        return self._next_positioned()
 
     @abc.abstractmethod
-    def next(self) -> int:
+    def _next_positioned(self) -> int:
         """
         Perform search and return the next value for `self.pos`.
+
+        This is `next` for a search item that is positioned (i.e., its
+        `self.pos` is a viable position from which to search).
         """
         raise NotImplementedError()  # pragma: no cover
 
     @abc.abstractmethod
-    def get_replace(self) -> str:
+    def _get_replace_str(self) -> str:
         """
         Return the string that should replace currently found substring.
+
+        This is `get_replace` for string `self.sub`.
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    @abc.abstractmethod
+    def _get_replace_callable(self) -> str:
+        """
+        Return the string that should replace currently found substring.
+
+        This is `get_replace` for callable `self.sub`.
         """
         raise NotImplementedError()  # pragma: no cover
 
@@ -189,13 +386,24 @@ class SearchItemStr(SearchItem):
         one_search: str,
         one_sub: "SimpleSubT",
     ) -> None:
-        if not unidecode_replace.str_case_sensitive:
-            one_search = one_search.lower()
-        if unidecode_replace.unidecoded_search:
-            one_search = unidecode(one_search)
-        if not one_search:
-            raise ValueError("search strings must not be empty")
+        one_search = _prepare_search_str(
+            one_search,
+            unidecode_replace.str_case_sensitive,
+            unidecode_replace.unidecoded_search,
+        )
         super().__init__(unidecode_replace, one_search, one_sub)
+        self._search_len = len(one_search)
+
+    @property
+    def search_re(self) -> re.Pattern:
+        """
+        Return the regex used to find the matches in `self.uni_str`.
+
+        Search strings are found with regexes as well, because a persistent
+        `finditer` iterator skips between the occurrences faster than
+        repeated calls to :py:meth:`str.index`.
+        """
+        return _compile_search_str(cast(str, self.search))
 
     @property
     def case_sensitive(self) -> bool:
@@ -214,48 +422,101 @@ class SearchItemStr(SearchItem):
             If nothing was found, the return value is `(-1, -1)`.
         """
         pos = self.pos
-        u2i = self.unidecode_replace.u2i
-        search_str = cast(str, self.search)
-        try:
-            return u2i[pos], u2i[pos + len(search_str)]
-        except KeyError:
+        if pos < 0:
             return -1, -1
+        u2i = self.unidecode_replace.u2i
+        return u2i[pos], u2i[pos + self._search_len]
 
-    def next(self) -> int:
+    def set_match(self, uni_m: re.Match) -> None:
+        """
+        Make `uni_m`, found in `self.uni_str` by `self.search_re`, the current
+        match.
+        """
+        self._pos = uni_m.start()
+
+    def _next_positioned(self) -> int:
         """
         Perform search and return the next value for `self.pos`.
+
+        This is `next` for a search item that is positioned.
         """
-        pos = self.pos if self.pos >= 0 else self.get_next_pos()
-        uni_str = self.uni_str
-        search_str = cast(str, self.search)
+        pos = self._pos
+        size = self._search_len
+        u2i = self.unidecode_replace.u2i
         while True:
-            try:
-                pos = uni_str.index(search_str, pos)
-            except ValueError:
+            uni_m = self._search(pos)
+            if uni_m is None:
                 return self.reset_search()
-            else:
-                if (
-                    pos == self.get_next_pos(min_pos=pos)
-                    and self.chunk_ok(pos, pos + len(search_str))
-                ):
+            pos = uni_m.start()
+            # Inlined `self.chunk_ok(pos, pos + size)`, checked first because
+            # it is much cheaper than moving `self.pos`.
+            if u2i[pos] >= 0 and u2i[pos + size] >= 0:
+                next_pos = self._advance_to(pos)
+                if next_pos == pos:
                     return pos
-            pos = self.get_next_pos(min_pos=pos + 1)
+                # Otherwise, `next_pos` is also the next position after `pos`.
+                pos = next_pos
+            else:
+                pos = self._advance_to(pos + 1)
             if pos < 0:
                 return -1
 
-    def get_replace(self) -> str:
+    def _get_replace_str(self) -> str:
         """
         Return the string that should replace currently found substring.
+
+        This is `get_replace` for string `self.sub`.
         """
-        if isinstance(self.sub, str):
-            return self.sub
-        elif callable(self.sub):
-            start, end = self.get_start_end()
-            return self.sub(self.unidecode_replace.string[start:end])
-        else:
-            raise TypeError(  # pragma: no cover
-                f"invalid type of a sub: {type(self.sub).__name__}",
-            )
+        return cast(str, self.sub)
+
+    def _get_replace_callable(self) -> str:
+        """
+        Return the string that should replace currently found substring.
+
+        This is `get_replace` for callable `self.sub`.
+        """
+        start, end = self.get_start_end()
+        return cast(Callable, self.sub)(
+            self.unidecode_replace.string[start:end],
+        )
+
+
+class SearchItemStrASCII(SearchItemStr):
+    """
+    One search string, searched for with the identity `u2i` mapping.
+
+    With the identity mapping (used for ASCII strings and for searches that
+    are not unidecoded), every position is a valid one and every chunk is ok,
+    so there is no need to check them.
+    """
+
+    def get_start_end(self) -> tuple[int, int]:
+        """
+        Return start and end indices of the last search in the original string.
+
+        :return: A tuple `(start, end)` such that
+            `self.unidecode_replace.string[start:end]` is the substring
+            corresponding to the last successfully found unidecoded substring.
+            If nothing was found, the return value is `(-1, -1)`.
+        """
+        pos = self._pos
+        return (-1, -1) if pos < 0 else (pos, pos + self._search_len)
+
+    def _next_positioned(self) -> int:
+        """
+        Perform search and return the next value for `self.pos`.
+
+        This is `next` for a search item that is positioned.
+        """
+        pos = self._pos
+        uni_m = self._search(pos)
+        if uni_m is None:
+            return self.reset_search()
+        pos = uni_m.start()
+        if pos >= self.unidecode_replace.endpos:
+            return self.reset_search()
+        self._pos = pos
+        return pos
 
 
 class SearchItemRegex(SearchItem):
@@ -271,67 +532,113 @@ class SearchItemRegex(SearchItem):
     ) -> None:
         if isinstance(one_search, re.Pattern):
             re_flags = re.RegexFlag(one_search.flags)
-            one_search = str(one_search.pattern)
-            if unidecode_replace.unidecoded_search:
-                one_search = unidecode(one_search)
+            one_search = _prepare_search_regex(
+                str(one_search.pattern),
+                re_flags,
+                unidecode_replace.unidecoded_search,
+            )
         else:
             re_flags = unidecode_replace.re_flags
+            one_search = _prepare_search_regex(
+                cast(str, one_search), re_flags, False,
+            )
 
-        if re.match(f"(?:{one_search})$", ""):
-            raise ValueError("search patterns must not match empty strings")
-
-        self._case_sensitive = not (re_flags & re.I)
+        super().__init__(unidecode_replace, one_search, one_sub)
+        if isinstance(one_sub, str) and "\\" not in one_sub:
+            # Templates without backslashes have nothing to expand, so the
+            # matches are never needed in their re-mapped form.
+            self.get_replace = self._get_replace_literal
+        # The current match (in `self.uni_str`) and its re-mapped version,
+        # created from it when first needed (see `m`).
+        self._uni_m: Optional[re.Match] = None
+        self._m: Optional[UnidecodeReMatch] = None
 
-        one_search = re.compile(one_search, flags=re_flags)
+    @property
+    def search_re(self) -> re.Pattern:
+        """
+        Return the regex used to find the matches in `self.uni_str`.
+        """
+        return cast(re.Pattern, self.search)
 
-        super().__init__(unidecode_replace, one_search, one_sub)
-        self.m: Optional[UnidecodeReMatch] = None
+    @property
+    def m(self) -> Optional[UnidecodeReMatch]:
+        """
+        Return the current match, re-mapped to the original string.
+        """
+        if self._m is None and self._uni_m is not None:
+            self._m = UnidecodeReMatch(self.unidecode_replace, self._uni_m)
+        return self._m
 
     @property
     def case_sensitive(self) -> bool:
         """
-        Return `True` if any the search is case-sensitive search.
+        Return `True`, because regexes are always searched for as they are.
+
+        Case-insensitive regexes deal with the case themselves (with `re.I`),
+        so they need no lowercase version of the searched string.
+        """
+        return True
+
+    def set_match(self, uni_m: re.Match) -> None:
+        """
+        Make `uni_m`, found in `self.uni_str` by `self.search_re`, the current
+        match.
         """
-        return self._case_sensitive
+        self._uni_m = uni_m
+        self._m = None
 
-    def next(self) -> int:
+    def _next_positioned(self) -> int:
         """
         Perform search and return the next value for `self.pos`.
+
+        This is `next` for a search item that is positioned.
         """
-        pos = self.pos if self.pos >= 0 else self.get_next_pos()
-        uni_str = self.uni_str
-        search_re = cast(re.Pattern, self.search)
+        pos = self._pos
+        u2i = self.unidecode_replace.u2i
         while True:
-            uni_m = search_re.search(uni_str, pos)
+            uni_m = self._search(pos)
             if uni_m is None:
-                self.m = None
+                self._uni_m = self._m = None
                 return -1
-            pos = uni_m.start()
-            end = uni_m.end()
-            if (
-                pos == self.get_next_pos(min_pos=pos)
-                and self.chunk_ok(pos, end)
-            ):
-                self.m = UnidecodeReMatch(self.unidecode_replace, uni_m)
-                return pos
-            pos = self.get_next_pos(min_pos=pos + 1)
+            pos, end = uni_m.span()
+            # Inlined `self.chunk_ok(pos, end)` (see `SearchItemStr`).
+            if u2i[pos] >= 0 and u2i[end] >= 0:
+                next_pos = self._advance_to(pos)
+                if next_pos == pos:
+                    self._uni_m = uni_m
+                    self._m = None
+                    return pos
+                # Otherwise, `next_pos` is also the next position after `pos`.
+                pos = next_pos
+            else:
+                pos = self._advance_to(pos + 1)
             if pos < 0:
                 return -1
 
-    def get_replace(self) -> str:
+    def _get_replace_str(self) -> str:
         """
         Return the string that should replace currently found substring.
+
+        This is `get_replace` for string `self.sub`.
         """
-        if self.m is None:  # pragma: no cover
-            raise ValueError("this should not have happened")
-        elif isinstance(self.sub, str):
-            return self.m.expand(self.sub)
-        elif callable(self.sub):
-            return self.sub(self.m)
-        else:
-            raise TypeError(  # pragma: no cover
-                f"invalid type of a sub: {type(self.sub).__name__}",
-            )
+        return cast(UnidecodeReMatch, self.m).expand(cast(str, self.sub))
+
+    def _get_replace_literal(self) -> str:
+        """
+        Return the string that should replace currently found substring.
+
+        This is `get_replace` for string `self.sub` without backslashes,
+        which expands to itself.
+        """
+        return cast(str, self.sub)
+
+    def _get_replace_callable(self) -> str:
+        """
+        Return the string that should replace currently found substring.
+
+        This is `get_replace` for callable `self.sub`.
+        """
+        return cast(Callable, self.sub)(self.m)
 
     def get_start_end(self) -> tuple[int, int]:
         """
@@ -342,10 +649,38 @@ class SearchItemRegex(SearchItem):
             corresponding to the last successfully found unidecoded substring.
             If nothing was found, the return value is `(-1, -1)`.
         """
-        if self.m is None:
+        uni_m = self._uni_m
+        if uni_m is None:
             return -1, -1
         else:
-            return self.m.start(), self.m.end()
+            u2i = self.unidecode_replace.u2i
+            return u2i[uni_m.start()], u2i[uni_m.end()]
+
+
+class SearchItemRegexASCII(SearchItemRegex):
+    """
+    One search regex, searched for with the identity `u2i` mapping.
+
+    With the identity mapping (used for ASCII strings and for searches that
+    are not unidecoded), every position is a valid one and every chunk is ok,
+    so there is no need to check them.
+    """
+
+    def _next_positioned(self) -> int:
+        """
+        Perform search and return the next value for `self.pos`.
+
+        This is `next` for a search item that is positioned.
+        """
+        pos = self._pos
+        uni_m = self._search(pos)
+        if uni_m is None or uni_m.start() >= self.unidecode_replace.endpos:
+            self._uni_m = self._m = None
+            return self.reset_search()
+        self._pos = pos = uni_m.start()
+        self._uni_m = uni_m
+        self._m = None
+        return pos
 
 
 def get_search_item(
@@ -365,11 +700,14 @@ def get_search_item(
     :return: An instance of the correct subclass of `SearchItem`.
     """
     if unidecode_replace.re_search and isinstance(one_search, str):
-        one_search = re.compile(one_search, flags=unidecode_replace.re_flags)
+        one_search = _compile_re(one_search, unidecode_replace.re_flags)
+    trivial_u2i = unidecode_replace.trivial_u2i
     if isinstance(one_search, str):
-        return SearchItemStr(unidecode_replace, one_search, one_sub)
+        return (SearchItemStrASCII if trivial_u2i else SearchItemStr)(
+            unidecode_replace, one_search, one_sub,
+        )
     elif isinstance(one_search, re.Pattern):
-        return SearchItemRegex(
+        return (SearchItemRegexASCII if trivial_u2i else SearchItemRegex)(
             unidecode_replace, one_search, one_sub,
         )
     else:
@@ -31,6 +31,30 @@ class TestMatch(TestsBase):
             self.string_swap_shi_zong,
         )
 
+    def test_expand_escapes(self):
+        self.assertEqual(
+            unidecode_replace(
+                self.string,
+                self.search_original,
+                lambda m: m.expand(r"[\g<0>|\g<zong>\n\101\\]"),
+            ),
+            "他现[失踪|踪\nA\\]已经[失踪|踪\nA\\]路上了。",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                self.string,
+                self.search_original,
+                lambda m: m.expand("\u0100\u0101\\1\u0102"),
+            ),
+            "他现\u0100\u0101失\u0102已经\u0100\u0101失\u0102路上了。",
+        )
+        with self.assertRaises(IndexError):
+            unidecode_replace(
+                self.string,
+                self.search_original,
+                lambda m: m.expand(r"\g<foo>"),
+            )
+
     def test_group(self):
         self.assertEqual(
             unidecode_replace(
@@ -107,6 +131,30 @@ class TestMatch(TestsBase):
             self.string_with_spans,
         )
 
+    def test_span_inside_chunk(self):
+        # >>> unidecode.unidecode("xaßb")
+        # 'xassb'
+        self.assertEqual(
+            unidecode_replace(
+                "xaßb",
+                re.compile("(a)s(s)()b"),
+                lambda m: repr(
+                    ([m.span(idx) for idx in range(4)], m.groups()),
+                ),
+            ),
+            "x([(1, 4), (1, 2), (2, 3), (3, 3)], ('a', 'ß', ''))",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "北亰",
+                re.compile("B(e)(i) (x)?"),
+                lambda m: repr(
+                    ([m.span(idx) for idx in range(4)], m.groups()),
+                ),
+            ),
+            "([(0, 1), (0, 1), (0, 1), (-1, -1)], ('北', '北', None))亰",
+        )
+
     def test_pos(self):
         self.assertEqual(
             unidecode_replace(
@@ -221,6 +269,26 @@ class TestMatch(TestsBase):
             "abc|||def",
         )
 
+    def test_repeated_groups_default(self):
+        def f(m):
+            results = [
+                (m.groups("-"), m.groupdict("-"), m.span(2), m.start("y"))
+                for _ in range(2)
+            ]
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(m.groups(), ("abc", None, None, "def"))
+            self.assertEqual(m.groupdict(), {"y": None})
+            return repr(results[0])
+
+        self.assertEqual(
+            unidecode_replace(
+                "abcdef",
+                re.compile("(?:([a-c]+)|(x*)|(?P<y>y*))([d-f]+)"),
+                f,
+            ),
+            "(('abc', '-', '-', 'def'), {'y': '-'}, (-1, -1), -1)",
+        )
+
     def test_pos_endpos(self):
         self.assertEqual(
             unidecode_replace(
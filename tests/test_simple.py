@@ -9,10 +9,10 @@ named `test_{type_of_test}_{type_of_search}_{type_of_replace}`.
 """
 
 import re
-import textwrap
 
 from unidecode_replace import (
-    unidecode_replace, unidecode_wrap, UnidecodeReplace,
+    unidecode_replace, unidecode_wrap, UnidecodeReplace, SearchItemRegex,
+    SearchItemRegexASCII,
 )
 
 from .utils import TestsBase
@@ -45,52 +45,87 @@ class TestSimple(TestsBase):
     short_search_str = "quick"
     short_search_re = r"([rd])(o)"
     short_sub_str = "ʞɔınb"
-    long_string = textwrap.dedent(
-        """\
-        Peter Piper picked a peck of pickled peppers
-        A peck of pickled peppers Peter Piper picked
-        If Peter Piper picked a peck of pickled peppers
-        Where’s the peck of pickled peppers Peter Piper picked? \
-        """,
+    long_string = (
+        "Peter Piper picked a peck of pickled peppers\n"
+        "A peck of pickled peppers Peter Piper picked\n"
+        "If Peter Piper picked a peck of pickled peppers\n"
+        "Where’s the peck of pickled peppers Peter Piper picked?         "
     )
     long_search_str = "peck"
     long_search_re = r"(pick)(led)?\b"
     long_sub_str = "ʞɔǝd"
 
+    # Compiled once, for the tests that search by (or compare to) regexes.
+    short_search_re_c = re.compile(short_search_re)
+    long_search_re_c = re.compile(long_search_re)
+    wrap_short_re = re.compile(
+        f"{re.escape(short_search_str)}|{short_search_re}",
+    )
+    wrap_long_re = re.compile(f"{re.escape(long_search_str)}|{long_search_re}")
+
+    # The strings with the search strings replaced, which the tests with both
+    # string and regex searches use as the base of their expected results.
+    short_string_replaced = short_string.replace(
+        short_search_str, short_sub_str,
+    )
+    long_string_replaced = long_string.replace(long_search_str, long_sub_str)
+    long_string_replaced_2 = long_string.replace(
+        long_search_str, long_sub_str, 2,
+    )
+
+    # Strings for the tests of edge cases and of `pos` and `endpos`.
+    ab_7 = 7 * "ab"
+    xyz_7 = 7 * "xyz"
+    pos_string = "abacada"
+    # Keyword arguments with `pos` and `endpos` and the expected results of
+    # replacing "a" in `pos_string` with them.
+    pos_endpos_cases = (
+        (dict(), "XbXcXdX"),
+        (dict(pos=0), "XbXcXdX"),
+        (dict(pos=1), "abXcXdX"),
+        (dict(pos=2), "abXcXdX"),
+        (dict(pos=3), "abacXdX"),
+        (dict(endpos=7), "XbXcXdX"),
+        (dict(endpos=6), "XbXcXda"),
+        (dict(endpos=5), "XbXcXda"),
+        (dict(endpos=4), "XbXcada"),
+        (dict(pos=0, endpos=7), "XbXcXdX"),
+        (dict(pos=1, endpos=6), "abXcXda"),
+        (dict(pos=2, endpos=5), "abXcXda"),
+        (dict(pos=3, endpos=4), "abacada"),
+        (dict(pos=5, endpos=4), "abacada"),
+    )
+
     def test_basic_str_str(self):
         self.assertEqual(
             unidecode_replace(
                 self.short_string, self.short_search_str, self.short_sub_str,
             ),
-            self.short_string.replace(
-                self.short_search_str, self.short_sub_str,
-            ),
+            self.short_string_replaced,
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string, self.long_search_str, self.long_sub_str,
             ),
-            self.long_string.replace(self.long_search_str, self.long_sub_str),
+            self.long_string_replaced,
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string, self.long_search_str, self.long_sub_str,
                 count=2,
             ),
-            self.long_string.replace(
-                self.long_search_str, self.long_sub_str, 2,
-            ),
+            self.long_string_replaced_2,
         )
 
     def test_basic_re_str(self):
         self.assertEqual(
             unidecode_replace(
                 self.short_string,
-                re.compile(self.short_search_re),
+                self.short_search_re_c,
                 self.short_sub_str,
             ),
             re.sub(
-                self.short_search_re,
+                self.short_search_re_c,
                 self.short_sub_str,
                 self.short_string,
             ),
@@ -98,11 +133,11 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                re.compile(self.long_search_re),
+                self.long_search_re_c,
                 self.long_sub_str,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 self.long_sub_str,
                 self.long_string,
             ),
@@ -110,12 +145,12 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                re.compile(self.long_search_re),
+                self.long_search_re_c,
                 self.long_sub_str,
                 count=2,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 self.long_sub_str,
                 self.long_string,
                 2,
@@ -131,7 +166,7 @@ class TestSimple(TestsBase):
                 re_search=True,
             ),
             re.sub(
-                self.short_search_re,
+                self.short_search_re_c,
                 self.short_sub_str,
                 self.short_string,
             ),
@@ -144,7 +179,7 @@ class TestSimple(TestsBase):
                 re_search=True,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 self.long_sub_str,
                 self.long_string,
             ),
@@ -158,7 +193,7 @@ class TestSimple(TestsBase):
                 count=2,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 self.long_sub_str,
                 self.long_string,
                 2,
@@ -196,11 +231,11 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.short_string,
-                re.compile(self.short_search_re),
+                self.short_search_re_c,
                 _fr,
             ),
             re.sub(
-                self.short_search_re,
+                self.short_search_re_c,
                 _fr,
                 self.short_string,
             ),
@@ -208,11 +243,11 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                re.compile(self.long_search_re),
+                self.long_search_re_c,
                 _fr,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 _fr,
                 self.long_string,
             ),
@@ -220,12 +255,12 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                re.compile(self.long_search_re),
+                self.long_search_re_c,
                 _fr,
                 count=2,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 _fr,
                 self.long_string,
                 2,
@@ -241,7 +276,7 @@ class TestSimple(TestsBase):
                 re_search=True,
             ),
             re.sub(
-                self.short_search_re,
+                self.short_search_re_c,
                 _fr,
                 self.short_string,
             ),
@@ -254,7 +289,7 @@ class TestSimple(TestsBase):
                 re_search=True,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 _fr,
                 self.long_string,
             ),
@@ -268,7 +303,7 @@ class TestSimple(TestsBase):
                 count=2,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 _fr,
                 self.long_string,
                 2,
@@ -279,44 +314,38 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.short_string,
-                [self.short_search_str, re.compile(self.short_search_re)],
+                [self.short_search_str, self.short_search_re_c],
                 [self.short_sub_str, "XXX"],
             ),
             re.sub(
-                self.short_search_re,
+                self.short_search_re_c,
                 "XXX",
-                self.short_string.replace(
-                    self.short_search_str, self.short_sub_str,
-                ),
+                self.short_string_replaced,
             ),
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                [self.long_search_str, re.compile(self.long_search_re)],
+                [self.long_search_str, self.long_search_re_c],
                 [self.long_sub_str, "XXX"],
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 "XXX",
-                self.long_string.replace(
-                    self.long_search_str, self.long_sub_str,
-                ),
+                self.long_string_replaced,
             ),
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                [self.long_search_str, re.compile(self.long_search_re)],
+                [self.long_search_str, self.long_search_re_c],
                 [self.long_sub_str, "XXX"],
                 count=3,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 "XXX",
-                self.long_string.replace(
-                    self.long_search_str, self.long_sub_str, 2,
-                ),
+                self.long_string_replaced_2,
                 1,
             ),
         )
@@ -325,44 +354,38 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_replace(
                 self.short_string,
-                [self.short_search_str, re.compile(self.short_search_re)],
+                [self.short_search_str, self.short_search_re_c],
                 self.short_sub_str,
             ),
             re.sub(
-                self.short_search_re,
+                self.short_search_re_c,
                 self.short_sub_str,
-                self.short_string.replace(
-                    self.short_search_str, self.short_sub_str,
-                ),
+                self.short_string_replaced,
             ),
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                [self.long_search_str, re.compile(self.long_search_re)],
+                [self.long_search_str, self.long_search_re_c],
                 self.long_sub_str,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 self.long_sub_str,
-                self.long_string.replace(
-                    self.long_search_str, self.long_sub_str,
-                ),
+                self.long_string_replaced,
             ),
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string,
-                [self.long_search_str, re.compile(self.long_search_re)],
+                [self.long_search_str, self.long_search_re_c],
                 self.long_sub_str,
                 count=3,
             ),
             re.sub(
-                self.long_search_re,
+                self.long_search_re_c,
                 self.long_sub_str,
-                self.long_string.replace(
-                    self.long_search_str, self.long_sub_str, 2,
-                ),
+                self.long_string_replaced_2,
                 1,
             ),
         )
@@ -371,57 +394,53 @@ class TestSimple(TestsBase):
         self.assertEqual(
             unidecode_wrap(
                 self.short_string,
-                [self.short_search_str, re.compile(self.short_search_re)],
+                [self.short_search_str, self.short_search_re_c],
                 "<<<",
                 ">>>",
             ),
-            re.sub(
-                f"{re.escape(self.short_search_str)}|{self.short_search_re}",
-                _fw,
-                self.short_string,
-            ),
+            self.wrap_short_re.sub(_fw, self.short_string),
         )
         self.assertEqual(
             unidecode_wrap(
                 self.long_string,
-                [self.long_search_str, re.compile(self.long_search_re)],
+                [self.long_search_str, self.long_search_re_c],
                 "<<<",
                 ">>>",
             ),
-            re.sub(
-                f"{re.escape(self.long_search_str)}|{self.long_search_re}",
-                _fw,
-                self.long_string,
-            ),
+            self.wrap_long_re.sub(_fw, self.long_string),
         )
         self.assertEqual(
             unidecode_wrap(
                 self.long_string,
-                [self.long_search_str, re.compile(self.long_search_re)],
+                [self.long_search_str, self.long_search_re_c],
                 "<<<",
                 ">>>",
                 count=3,
             ),
-            re.sub(
-                f"{re.escape(self.long_search_str)}|{self.long_search_re}",
-                _fw,
-                self.long_string,
-                3,
+            self.wrap_long_re.sub(_fw, self.long_string, 3),
+        )
+        self.assertEqual(
+            unidecode_wrap(
+                self.short_string,
+                self.short_search_re,
+                "<<<",
+                ">>>",
+                re_search=True,
             ),
+            self.short_search_re_c.sub(_fw, self.short_string),
         )
 
     def test_search_item_repr(self):
         import unidecode_replace.search_item as module
+        unidecode_replace = UnidecodeReplace("Text", "ex", "Sub")
         for class_name, search_repr in (
             ("SearchItemStr", "'ex'"),
             ("SearchItemRegex", "re.compile('ex')"),
+            ("SearchItemStrASCII", "'ex'"),
+            ("SearchItemRegexASCII", "re.compile('ex')"),
         ):
             class_ = getattr(module, class_name)
-            instance = class_(
-                UnidecodeReplace("Text", "ex", "Sub"),
-                "ex",
-                "Sub",
-            )
+            instance = class_(unidecode_replace, "ex", "Sub")
             self.assertEqual(
                 repr(instance),
                 f"{class_name}({search_repr}, 'Sub', pos=-1)",
@@ -450,142 +469,239 @@ class TestSimple(TestsBase):
             "abcxxc",
         )
 
+    def test_overlaps_single_chars(self):
+        self.assertEqual(
+            unidecode_replace("abab", "b", "x", allow_overlaps=True),
+            "axax",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "abab", re.compile("b"), "x", allow_overlaps=True,
+            ),
+            "axax",
+        )
+
+    def test_skipped_overlaps(self):
+        self.assertEqual(
+            unidecode_replace("abcXd", ["abc", "cX"], ["1", "2"]),
+            "1Xd",
+        )
+        self.assertEqual(
+            unidecode_replace("abcXdcX", ["abc", "cX"], ["1", "2"]),
+            "1Xd2",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "abcXd", [re.compile("abc"), "cX"], ["1", "2"],
+            ),
+            "1Xd",
+        )
+
+    def test_combined_regexes(self):
+        self.assertEqual(
+            unidecode_replace(
+                "abcdcba",
+                [re.compile("(c)(b)"), re.compile("(a)(b)"), re.compile("d")],
+                [r"\2\1", r"<\2\1>", "D"],
+            ),
+            "<ba>cDbca",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "abcabc",
+                [re.compile("ab"), re.compile("abc")],
+                ["1", "2"],
+            ),
+            "1c1c",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "abcabc",
+                [re.compile("(b)\\1?c"), re.compile("a")],
+                ["1", "2"],
+            ),
+            "2121",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "a b ab",
+                [re.compile("a #", re.X), re.compile("\nb", re.X)],
+                ["1", "2"],
+            ),
+            "1 2 12",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "a B aB",
+                [re.compile("a #", re.X), re.compile("b # x", re.X | re.I)],
+                ["1", "2"],
+            ),
+            "1 2 12",
+        )
+
+    def test_combined_strings(self):
+        self.assertEqual(
+            unidecode_replace(
+                "abcabc. a+b",
+                ["ab", "abc", re.compile("c+"), "a+b"],
+                ["1", "2", "3", "4"],
+            ),
+            "1313. 4",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "AbcaBc", ["abc", "b"], ["1", "2"], str_case_sensitive=False,
+            ),
+            "11",
+        )
+
+    def test_combined_strings_trie(self):
+        self.assertEqual(
+            unidecode_replace(
+                "unidecoded, unidecode, uni, un",
+                ["unidecoded", "uni", "unidecode", "n"],
+                ["1", "2", "3", "4"],
+            ),
+            "1, 2decode, 2, u4",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "Běijīng", ["bei", "be", "jing", "ji"], ["1", "2", "3", "4"],
+                str_case_sensitive=False,
+            ),
+            "13",
+        )
+
+    def test_combined_regexes_mixed_flags(self):
+        self.assertEqual(
+            unidecode_replace(
+                "aAbB\nc",
+                [
+                    re.compile("a", re.I),
+                    re.compile("b"),
+                    re.compile("^c", re.M),
+                ],
+                ["1", "2", "3"],
+            ),
+            "112B\n3",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "aAbB",
+                [re.compile("a", re.I), re.compile("b")],
+                ["1", "2"],
+                unidecoded_search=False,
+            ),
+            "112B",
+        )
+
     def test_empty_search(self):
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", list(), "something")
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", "", "something")
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", "", "something", re_search=True)
+        for search, kwargs in (
+            (list(), dict()),
+            ("", dict()),
+            ("", dict(re_search=True)),
+            (re.compile("(?i)x?"), dict()),
+            (re.compile(" # x", re.X), dict()),
+        ):
+            with self.subTest(search=search, **kwargs):
+                with self.assertRaises(ValueError):
+                    unidecode_replace("Text", search, "something", **kwargs)
 
     def test_wrong_search_type(self):
         with self.assertRaises(TypeError):
             unidecode_replace("Text", 13.17, "something")
 
     def test_wrong_amount_of_subs(self):
-        # No subs for one search.
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", "something", list())
-
-        # Too many subs for one search.
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", "something", ["foo", "bar"])
-
-        # No subs for multiple searches.
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", ["some", "thing"], list())
-
-        # Too few subs for multiple searches.
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", ["some", "th", "ing"], ["foo", "bar"])
-
-        # Too many subs for multiple searches.
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", ["some", "thing"], ["foo", "bar", "fb"])
+        for search, sub in (
+            # No subs for one search.
+            ("something", list()),
+            # Too many subs for one search.
+            ("something", ["foo", "bar"]),
+            # No subs for multiple searches.
+            (["some", "thing"], list()),
+            # Too few subs for multiple searches.
+            (["some", "th", "ing"], ["foo", "bar"]),
+            # Too many subs for multiple searches.
+            (["some", "thing"], ["foo", "bar", "fb"]),
+        ):
+            with self.subTest(search=search, sub=sub):
+                with self.assertRaises(ValueError):
+                    unidecode_replace("Text", search, sub)
 
     def test_wrong_sub(self):
         with self.assertRaises(TypeError):
             unidecode_replace("Text", "foo", 13.17)
 
     def test_bad_count(self):
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", "foo", "bar", count=-17)
-        with self.assertRaises(ValueError):
-            unidecode_replace("Text", "foo", "bar", count=17.19)
+        for count in (-17, 17.19):
+            with self.subTest(count=count):
+                with self.assertRaises(ValueError):
+                    unidecode_replace("Text", "foo", "bar", count=count)
 
     def test_search_item_init(self):
         import unidecode_replace.search_item as module
+        unidecode_replace = UnidecodeReplace("Text", "ex", "Sub")
         for class_name in ("SearchItemStr", "SearchItemRegex"):
             class_ = getattr(module, class_name)
             self.assertEqual(
-                class_(
-                    UnidecodeReplace("Text", "ex", "Sub"),
-                    "ex",
-                    "Sub",
-                ).get_start_end(),
+                class_(unidecode_replace, "ex", "Sub").get_start_end(),
                 (-1, -1),
             )
 
+    def test_search_item_regex_match(self):
+        for class_, string in (
+            (SearchItemRegex, "T\u00e9xt"), (SearchItemRegexASCII, "Text"),
+        ):
+            unidecode_replace = UnidecodeReplace(string, "ex", "Sub")
+            for sub, replace in (
+                ("Sub", "Sub"), (r"<\g<0>>", f"<{string[1:3]}>"),
+            ):
+                with self.subTest(class_=class_.__name__, sub=sub):
+                    instance = class_(
+                        unidecode_replace, re.compile("ex"), sub,
+                    )
+                    instance.next()
+                    self.assertEqual(instance.get_start_end(), (1, 3))
+                    self.assertEqual(instance.m.span(), (1, 3))
+                    self.assertEqual(instance.get_replace(), replace)
+
     def test_edge_cases(self):
         self.assertEqual(unidecode_replace("aba", "aba", "xyz"), "xyz")
         self.assertEqual(unidecode_replace("abab", "aba", "xyz"), "xyzb")
         self.assertEqual(unidecode_replace("abab", "bab", "xyz"), "axyz")
         self.assertEqual(unidecode_replace("ab~ab", "ab", "xyz"), "xyz~xyz")
-        self.assertEqual(unidecode_replace(7 * "ab", "ab", "xyz"), 7 * "xyz")
+        self.assertEqual(
+            unidecode_replace(self.ab_7, "ab", "xyz"), self.xyz_7,
+        )
 
     def test_pos_endpos(self):
         # In effect, same searches and replacements, but one is a search by a
         # string and the other is a search by a regular expression.
+        string = self.pos_string
         for search_by, search in (
             ("string", "a"), ("regex", re.compile(r"[ay]")),
         ):
+            for kwargs, expected in self.pos_endpos_cases:
+                with self.subTest(search_by=search_by, **kwargs):
+                    self.assertEqual(
+                        unidecode_replace(string, search, "X", **kwargs),
+                        expected,
+                    )
+
+    def test_pos_endpos_not_unidecoded(self):
+        string = self.pos_string
+        for search in ("a", re.compile("a")):
             self.assertEqual(
-                unidecode_replace("abacada", search, "X"),
-                "XbXcXdX",
-                msg=f"search by {search_by}",
-            )
-
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=0),
-                "XbXcXdX",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=1),
-                "abXcXdX",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=2),
-                "abXcXdX",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=3),
+                unidecode_replace(
+                    string, search, "X", pos=3, unidecoded_search=False,
+                ),
                 "abacXdX",
-                msg=f"search by {search_by}",
-            )
-
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", endpos=7),
-                "XbXcXdX",
-                msg=f"search by {search_by}",
             )
             self.assertEqual(
-                unidecode_replace("abacada", search, "X", endpos=6),
-                "XbXcXda",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", endpos=5),
-                "XbXcXda",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", endpos=4),
-                "XbXcada",
-                msg=f"search by {search_by}",
-            )
-
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=0, endpos=7),
-                "XbXcXdX",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=1, endpos=6),
-                "abXcXda",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=2, endpos=5),
-                "abXcXda",
-                msg=f"search by {search_by}",
-            )
-            self.assertEqual(
-                unidecode_replace("abacada", search, "X", pos=3, endpos=4),
-                "abacada",
-                msg=f"search by {search_by}",
+                unidecode_replace(
+                    string, search, "X", endpos=2, unidecoded_search=False,
+                ),
+                "Xbacada",
             )
 
     def test_get_next_pos_done(self):
@@ -593,17 +709,24 @@ class TestSimple(TestsBase):
             unidecode_replace = UnidecodeReplace(
                 "abcd", "b", "X", unidecoded_search=unidecoded_search,
             )
-            for i in range(2, 4):
+            search_item = unidecode_replace.search_items[0]
+            with self.subTest(unidecoded_search=unidecoded_search):
                 self.assertEqual(
-                    unidecode_replace.search_items[0].get_next_pos(),
-                    i,
-                    f"unidecoded_search={unidecoded_search}, i={i}",
+                    [search_item.get_next_pos() for _ in range(3)],
+                    [2, 3, -1],
                 )
-            self.assertEqual(
-                unidecode_replace.search_items[0].get_next_pos(),
-                -1,
-                f"unidecoded_search={unidecoded_search}, last one",
-            )
+
+    def test_search_items_combined(self):
+        unidecode_replace = UnidecodeReplace("abcdb", ["b", "x", "c"], "X")
+        self.assertIsNotNone(unidecode_replace.combined_search)
+        self.assertEqual(
+            [
+                (search_item.search, search_item.pos)
+                for search_item in unidecode_replace.search_items
+            ],
+            [("b", 1), ("c", 2)],
+        )
+        self.assertEqual(unidecode_replace.run(), "aXXdX")
 
     def test_check_consecutives(self):
         self.assertEqual(unidecode_replace("abba", "b", "X"), "aXXa")
@@ -13,27 +13,46 @@ import re
 
 from unidecode import unidecode
 
-from unidecode_replace import unidecode_replace, unidecode_wrap
+from unidecode_replace import (
+    unidecode_replace, unidecode_wrap, UnidecodeReplace,
+)
 
 from .utils import TestsBase
 
 
 class TestSpecial(TestsBase):
 
+    # The strings used by the tests are unidecoded here, once, and the tests
+    # use these attributes instead of calling `unidecode` themselves.
     short_string = "他现在已经在路上了。"
+    short_string_unidecoded = unidecode(short_string)
     short_result = "他现失踪已经失踪路上了。"
-    long_string = short_string + unidecode(short_string)
+    short_result_unidecoded = unidecode(short_result)
+    long_string = short_string + short_string_unidecoded
     search_str_1 = "在"
     search_str_2 = unidecode(search_str_1)
     search_re_1 = r"(在)(已)"
     search_re_2 = unidecode(search_re_1)
     sub_str = "失踪"
+    sub_str_unidecoded = unidecode(sub_str)
+    # The result for `long_string`, i.e., `short_result` followed by its
+    # unidecoded version, except for the `sub_str` parts.
+    long_result = short_result + short_result_unidecoded.replace(
+        sub_str_unidecoded, sub_str,
+    )
+    # Replaces the single character `search_str_1` with "XYZ".
+    search_str_1_table = str.maketrans({search_str_1: "XYZ"})
+    wrap_result = "他现<<<在>>>已经<<<在>>>路上了。"
+    wrap_result_unidecoded = unidecode(wrap_result)
 
     case_string = "Übergröße oder ÜBERGRÖẞE"
     expected_str_sensitive = "Übergr!ße !der ÜBERGRÖẞE"
     expected_str_insensitive = "Übergr!ße !der ÜBERGR!ẞE"
     expected_regex_sensitive = "Übergr!ße !der ÜBERGRÖẞE"
     expected_regex_insensitive = "!bergr!ße !der !BERGR!ẞE"
+    case_search_re = re.compile("[öü]")
+    case_search_re_i = re.compile("[öü]", flags=re.I)
+    no_re_flags = re.RegexFlag(0)
 
     def test_unidecode_str(self):
         self.assertEqual(
@@ -50,23 +69,17 @@ class TestSpecial(TestsBase):
         )
 
     def test_mixed_str(self):
-        def unidecode_except_sub(s: str) -> str:
-            """
-            Unidecode `s` except for the `sub_str` part.
-            """
-            return unidecode(s).replace(unidecode(self.sub_str), self.sub_str)
-
         self.assertEqual(
             unidecode_replace(
                 self.long_string, self.search_str_1, self.sub_str,
             ),
-            self.short_result + unidecode_except_sub(self.short_result),
+            self.long_result,
         )
         self.assertEqual(
             unidecode_replace(
                 self.long_string, self.search_str_2, self.sub_str,
             ),
-            self.short_result + unidecode_except_sub(self.short_result),
+            self.long_result,
         )
 
     def test_mixed_str_not_unidecoded(self):
@@ -77,7 +90,7 @@ class TestSpecial(TestsBase):
                 "XYZ",
                 unidecoded_search=False,
             ),
-            self.long_string.replace(self.search_str_1, "XYZ"),
+            self.long_string.translate(self.search_str_1_table),
         )
         self.assertEqual(
             unidecode_replace(
@@ -90,16 +103,15 @@ class TestSpecial(TestsBase):
         )
 
     def test_wrap(self):
-        short_result = "他现<<<在>>>已经<<<在>>>路上了。"
         self.assertEqual(
             unidecode_wrap(
                 self.long_string, self.search_str_1, "<<<", ">>>",
             ),
-            short_result + unidecode(short_result),
+            self.wrap_result + self.wrap_result_unidecoded,
         )
 
     def test_dont_replace_partial_characters(self):
-        # See docstring in unidecode_replace.search_item.SearchItem.chunjk_ok.
+        # See docstring in unidecode_replace.search_item.SearchItem.chunk_ok.
         self.assertEqual(
             unidecode_replace("北亰", "ei", "sub"),
             "北亰",
@@ -109,6 +121,30 @@ class TestSpecial(TestsBase):
             "北亰",
         )
 
+    def test_chunk_ok(self):
+        search_item = UnidecodeReplace("北亰", "Bei ", "sub").search_items[0]
+        self.assertEqual(
+            [
+                search_item.chunk_ok(start, end)
+                for start, end in ((0, 4), (4, 9), (0, 9), (1, 3), (0, 5))
+            ],
+            [True, True, True, False, False],
+        )
+
+    def test_dont_replace_partial_characters_combined(self):
+        self.assertEqual(
+            unidecode_replace(
+                "北亰", [re.compile("ei"), re.compile("Jing ")], "sub",
+            ),
+            "北sub",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "北亰", [re.compile("Be"), re.compile("Bei ")], ["1", "2"],
+            ),
+            "2亰",
+        )
+
     def test_pos_endpos(self):
         self.assertEqual(
             unidecode_wrap(
@@ -123,6 +159,19 @@ class TestSpecial(TestsBase):
             "他现<<<在>>>已经在路上了。"
         )
 
+    def test_single_char_replacements(self):
+        # Every character here unidecodes to exactly one character.
+        self.assertEqual(
+            unidecode_replace("café, naïve café", "cafe", "bar", pos=1),
+            "café, naïve bar",
+        )
+        self.assertEqual(
+            unidecode_replace(
+                "café, naïve café", re.compile(r"\w+"), r"<\g<0>>", endpos=11,
+            ),
+            "<café>, <naïve> café",
+        )
+
     def test_case_sensitive(self):
         self.assertEqual(
             unidecode_replace(self.case_string, "ö", "!"),
@@ -147,103 +196,116 @@ class TestSpecial(TestsBase):
     def test_case_insensitive_re_flags_on_regex(self):
         # str_case_sensitive should have no effect on regex searches.
         for str_case_sensitive in (False, True):
-            msg_fmt = (
-                f"Case {{}} regex search with"
-                f" str_case_sensitive={str_case_sensitive}"
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    "[öü]",
-                    "!",
-                    str_case_sensitive=str_case_sensitive,
-                    re_search=True,
-                ),
-                self.expected_regex_sensitive,
-                msg_fmt.format("sensitive"),
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    "[öü]",
-                    "!",
-                    str_case_sensitive=str_case_sensitive,
-                    re_search=True,
-                    re_flags=re.I,
-                ),
-                self.expected_regex_insensitive,
-                msg_fmt.format("insensitive"),
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    re.compile("[öü]"),
-                    "!",
-                    str_case_sensitive=str_case_sensitive,
-                    re_search=True,
-                ),
-                self.expected_regex_sensitive,
-                msg_fmt.format("sensitive"),
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    re.compile("[öü]"),
-                    "!",
-                    str_case_sensitive=str_case_sensitive,
-                    re_search=True,
-                    re_flags=re.I,  # Should be ignored!
-                ),
-                self.expected_regex_sensitive,
-                msg_fmt.format("sensitive"),
-            )
+            with self.subTest(str_case_sensitive=str_case_sensitive):
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        "[öü]",
+                        "!",
+                        str_case_sensitive=str_case_sensitive,
+                        re_search=True,
+                    ),
+                    self.expected_regex_sensitive,
+                )
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        "[öü]",
+                        "!",
+                        str_case_sensitive=str_case_sensitive,
+                        re_search=True,
+                        re_flags=re.I,
+                    ),
+                    self.expected_regex_insensitive,
+                )
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        self.case_search_re,
+                        "!",
+                        str_case_sensitive=str_case_sensitive,
+                        re_search=True,
+                    ),
+                    self.expected_regex_sensitive,
+                )
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        self.case_search_re,
+                        "!",
+                        str_case_sensitive=str_case_sensitive,
+                        re_search=True,
+                        re_flags=re.I,  # Should be ignored!
+                    ),
+                    self.expected_regex_sensitive,
+                )
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        self.case_search_re_i,
+                        "!",
+                        str_case_sensitive=str_case_sensitive,
+                        re_search=True,
+                    ),
+                    self.expected_regex_insensitive,
+                )
+
+    def test_case_insensitive_regex_lowercase_length(self):
+        # "\u0130".lower() has two characters, which must not shift matches.
+        self.assertEqual(
+            unidecode_replace(
+                "\u0130ab",
+                re.compile("b", re.I),
+                "X",
+                unidecoded_search=False,
+            ),
+            "\u0130aX",
+        )
+
+    def test_case_insensitive_string_lowercase_length(self):
+        # The same for strings, which search the lowercase string instead.
+        for search, expected in (("ab", "\u0130X"), ("\u0130", "Xab")):
             self.assertEqual(
                 unidecode_replace(
-                    self.case_string,
-                    re.compile("[öü]", flags=re.I),
-                    "!",
-                    str_case_sensitive=str_case_sensitive,
-                    re_search=True,
+                    "\u0130ab",
+                    search,
+                    "X",
+                    unidecoded_search=False,
+                    str_case_sensitive=False,
                 ),
-                self.expected_regex_insensitive,
-                msg_fmt.format("insensitive"),
+                expected,
             )
 
     def test_case_insensitive_re_flags_on_string(self):
         # re_flags should have no effect on string searches.
-        for re_flags in (re.RegexFlag(0), re.I):
-            msg_fmt = (
-                f"Case {{}} string search with re_flags={re_flags}"
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    "ö",
-                    "!",
-                    re_flags=re_flags,
-                ),
-                self.expected_str_sensitive,
-                msg_fmt.format("sensitive"),
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    "ö",
-                    "!",
-                    re_flags=re_flags,
-                    str_case_sensitive=True,
-                ),
-                self.expected_str_sensitive,
-                msg_fmt.format("sensitive"),
-            )
-            self.assertEqual(
-                unidecode_replace(
-                    self.case_string,
-                    "ö",
-                    "!",
-                    re_flags=re_flags,
-                    str_case_sensitive=False,
-                ),
-                self.expected_str_insensitive,
-                msg_fmt.format("insensitive"),
-            )
+        for re_flags in (self.no_re_flags, re.I):
+            with self.subTest(re_flags=re_flags):
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        "ö",
+                        "!",
+                        re_flags=re_flags,
+                    ),
+                    self.expected_str_sensitive,
+                )
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        "ö",
+                        "!",
+                        re_flags=re_flags,
+                        str_case_sensitive=True,
+                    ),
+                    self.expected_str_sensitive,
+                )
+                self.assertEqual(
+                    unidecode_replace(
+                        self.case_string,
+                        "ö",
+                        "!",
+                        re_flags=re_flags,
+                        str_case_sensitive=False,
+                    ),
+                    self.expected_str_insensitive,
+                )
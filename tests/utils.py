@@ -21,3 +21,14 @@ class TestsBase(unittest.TestCase):
         For future uses (common resets between runs).
         """
         pass
+
+    def assertEqual(self, first, second, msg=None):
+        """
+        Assert that `first` and `second` are equal.
+
+        Equal values pass with a single comparison. Only unequal ones go
+        through the type-specific comparison of `unittest` (e.g., the diffs
+        of strings) to produce the failure message.
+        """
+        if not first == second:
+            super().assertEqual(first, second, msg)